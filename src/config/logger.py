@@ -16,6 +16,11 @@ def _should_log(level: str) -> bool:
     return LEVELS.get(level, 0) >= _current_level
 
 
+def is_debug_enabled() -> bool:
+    """Checks if debug messages are emitted, to skip building their data."""
+    return _should_log("debug")
+
+
 def _format_value(value: Any, max_length: int = 150) -> str:
     if value is None:
         return "None"
@@ -9,7 +9,7 @@ from typing import Optional, Literal
 AppointmentStatus = Literal["scheduled", "completed", "cancelled", "no_show"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Appointment:
     """An appointment is a service booking at a specific time."""
 
@@ -1,12 +1,12 @@
 """Service entity - represents a service offered by the business."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Service:
     """A service is something the business offers to customers."""
 
@@ -20,6 +20,11 @@ class Service:
     created_at: Optional[datetime] = None
     is_active: bool = True
     category_name: Optional[str] = None
+    price_float: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Caches the price as float for tool responses."""
+        self.price_float = float(self.price)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Service":
@@ -59,7 +64,7 @@ class Service:
     @property
     def price_formatted(self) -> str:
         """Price formatted with currency symbol."""
-        return f"${float(self.price):.2f}"
+        return f"${self.price_float:.2f}"
 
     @property
     def duration_formatted(self) -> str:
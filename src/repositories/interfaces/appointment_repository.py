@@ -21,10 +21,24 @@ class IAppointmentRepository(ABC):
         pass
 
     @abstractmethod
-    def get_upcoming_by_user(self, user_id: str) -> list[Appointment]:
+    def get_upcoming_by_user(
+        self, user_id: str, today: Optional[date] = None
+    ) -> list[Appointment]:
         """Gets future appointments for a user."""
         pass
 
+    @abstractmethod
+    def get_recent_past_by_user(
+        self, user_id: str, today: Optional[date] = None, limit: int = 5
+    ) -> list[Appointment]:
+        """Gets the most recent non-upcoming appointments for a user."""
+        pass
+
+    @abstractmethod
+    def count_by_user(self, user_id: str) -> int:
+        """Counts all appointments for a user."""
+        pass
+
     @abstractmethod
     def get_by_calendar_and_date(
         self, calendar_id: str, appointment_date: date
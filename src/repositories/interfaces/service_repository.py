@@ -24,7 +24,17 @@ class IServiceRepository(ABC):
         """Gets all active services for a category."""
         pass
 
+    @abstractmethod
+    def get_by_category_ids(self, category_ids: list[str]) -> list[Service]:
+        """Gets all active services for several categories in one query."""
+        pass
+
     @abstractmethod
     def find_by_name(self, branch_id: str, name: str) -> Optional[Service]:
         """Finds a service by partial name within a branch."""
         pass
+
+    @abstractmethod
+    def suggest_names(self, branch_id: str, name: str, limit: int = 5) -> list[str]:
+        """Gets names of branch services to suggest when a lookup fails."""
+        pass
@@ -46,9 +46,11 @@ class SQLiteAppointmentRepository(IAppointmentRepository):
             log.debug("repo.appointment", "get_by_user result", count=len(results))
             return results
 
-    def get_upcoming_by_user(self, user_id: str) -> list[Appointment]:
+    def get_upcoming_by_user(
+        self, user_id: str, today: Optional[date] = None
+    ) -> list[Appointment]:
         """Gets future appointments for a user."""
-        today = date.today()
+        today = today or date.today()
         log.debug(
             "repo.appointment", "get_upcoming_by_user", user_id=user_id, today=str(today)
         )
@@ -66,6 +68,46 @@ class SQLiteAppointmentRepository(IAppointmentRepository):
             )
             return results
 
+    def get_recent_past_by_user(
+        self, user_id: str, today: Optional[date] = None, limit: int = 5
+    ) -> list[Appointment]:
+        """Gets the most recent non-upcoming appointments for a user.
+
+        Non-upcoming means dated before today or no longer scheduled.
+        """
+        today = today or date.today()
+        log.debug(
+            "repo.appointment",
+            "get_recent_past_by_user",
+            user_id=user_id,
+            today=str(today),
+            limit=limit,
+        )
+        with self._conn.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT * FROM appointments
+                   WHERE user_id = ? AND (appointment_date < ? OR status != 'scheduled')
+                   ORDER BY appointment_date DESC, start_time DESC
+                   LIMIT ?""",
+                (user_id, today, limit),
+            )
+            results = [Appointment.from_dict(dict(row)) for row in cursor.fetchall()]
+            log.debug(
+                "repo.appointment", "get_recent_past_by_user result", count=len(results)
+            )
+            return results
+
+    def count_by_user(self, user_id: str) -> int:
+        """Counts all appointments for a user."""
+        log.debug("repo.appointment", "count_by_user", user_id=user_id)
+        with self._conn.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM appointments WHERE user_id = ?", (user_id,)
+            )
+            return cursor.fetchone()[0]
+
     def get_by_calendar_and_date(
         self, calendar_id: str, appointment_date: date
     ) -> list[Appointment]:
@@ -59,6 +59,23 @@ class SQLiteServiceRepository(IServiceRepository):
             log.debug("repo.service", "get_by_category result", count=len(results))
             return results
 
+    def get_by_category_ids(self, category_ids: list[str]) -> list[Service]:
+        """Gets all active services for several categories in one query."""
+        log.debug("repo.service", "get_by_category_ids", count=len(category_ids))
+        if not category_ids:
+            return []
+        placeholders = ", ".join("?" * len(category_ids))
+        with self._conn.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""SELECT * FROM services
+                    WHERE category_id IN ({placeholders}) AND is_active = 1""",
+                tuple(category_ids),
+            )
+            results = [Service.from_dict(dict(row)) for row in cursor.fetchall()]
+            log.debug("repo.service", "get_by_category_ids result", count=len(results))
+            return results
+
     def find_by_name(self, branch_id: str, name: str) -> Optional[Service]:
         """Finds a service by partial name within a branch."""
         log.debug("repo.service", "find_by_name", branch_id=branch_id, name=name)
@@ -80,3 +97,22 @@ class SQLiteServiceRepository(IServiceRepository):
                 matched_name=result.name if result else None,
             )
             return result
+
+    def suggest_names(self, branch_id: str, name: str, limit: int = 5) -> list[str]:
+        """Gets names of branch services to suggest when a lookup fails.
+
+        Names sharing the first letters of the query are listed first.
+        """
+        log.debug("repo.service", "suggest_names", branch_id=branch_id, name=name)
+        with self._conn.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT name FROM services
+                   WHERE branch_id = ? AND is_active = 1
+                   ORDER BY LOWER(name) LIKE LOWER(?) DESC, name
+                   LIMIT ?""",
+                (branch_id, f"{name[:3]}%", limit),
+            )
+            results = [row["name"] for row in cursor.fetchall()]
+            log.debug("repo.service", "suggest_names result", count=len(results))
+            return results
@@ -97,6 +97,7 @@ def create_appointment(
         apt_date,
         duration,
         use_google=True,
+        fresh=True,
     )
 
     log.debug(
@@ -218,7 +219,7 @@ def create_appointment(
             "date": apt_date.strftime("%A %d de %B"),
             "time": apt_time.strftime("%H:%M"),
             "duration": f"{duration} minutos",
-            "price": f"${float(service.price):.2f}",
+            "price": f"${service.price_float:.2f}",
         },
         "reminder": "Te enviaré un recordatorio antes de tu cita.",
     }
@@ -261,16 +262,8 @@ def get_user_appointments(user_id: str) -> dict | str:
                 "appointment_id": apt.id,
                 "service": apt.service_name_snapshot,
                 "employee": apt.calendar_name_snapshot,
-                "date": (
-                    apt.appointment_date.isoformat()
-                    if hasattr(apt.appointment_date, "isoformat")
-                    else apt.appointment_date
-                ),
-                "time": (
-                    apt.start_time.strftime("%H:%M")
-                    if hasattr(apt.start_time, "strftime")
-                    else apt.start_time
-                ),
+                "date": apt.appointment_date.isoformat(),
+                "time": apt.start_time.strftime("%H:%M"),
                 "status": apt.status,
             }
             for apt in upcoming
@@ -326,16 +319,8 @@ def cancel_appointment(appointment_id: str, reason: str) -> dict | str:
         "message": "Cita cancelada correctamente.",
         "cancelled_appointment": {
             "service": appointment.service_name_snapshot,
-            "date": (
-                appointment.appointment_date.isoformat()
-                if hasattr(appointment.appointment_date, "isoformat")
-                else appointment.appointment_date
-            ),
-            "time": (
-                appointment.start_time.strftime("%H:%M")
-                if hasattr(appointment.start_time, "strftime")
-                else appointment.start_time
-            ),
+            "date": appointment.appointment_date.isoformat(),
+            "time": appointment.start_time.strftime("%H:%M"),
             "reason": reason,
         },
     }
@@ -389,6 +374,7 @@ def reschedule_appointment(
         apt_date,
         duration,
         use_google=True,
+        fresh=True,
     )
 
     if apt_time not in available_slots:
@@ -453,15 +439,7 @@ def reschedule_appointment(
             "time": apt_time.strftime("%H:%M"),
         },
         "previous": {
-            "date": (
-                appointment.appointment_date.isoformat()
-                if hasattr(appointment.appointment_date, "isoformat")
-                else appointment.appointment_date
-            ),
-            "time": (
-                appointment.start_time.strftime("%H:%M")
-                if hasattr(appointment.start_time, "strftime")
-                else appointment.start_time
-            ),
+            "date": appointment.appointment_date.isoformat(),
+            "time": appointment.start_time.strftime("%H:%M"),
         },
     }
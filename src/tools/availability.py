@@ -8,6 +8,10 @@ from ..constants.config_keys import ConfigKeys, ConfigDefaults
 from .calendar_integration import (
     get_calendar_client,
     calculate_available_slots,
+    build_day_mask,
+    enumerate_slots,
+    get_cached_day_mask,
+    cache_day_mask,
     GoogleCalendarClient,
 )
 
@@ -18,6 +22,7 @@ def _get_available_slots_for_calendar(
     target_date: date,
     duration_minutes: int,
     use_google: bool = True,
+    fresh: bool = False,
 ) -> list[time]:
     """Gets available slots for a specific calendar.
 
@@ -30,6 +35,8 @@ def _get_available_slots_for_calendar(
         target_date: Date to query.
         duration_minutes: Service duration.
         use_google: Whether to use Google Calendar (default True).
+        fresh: Whether to skip cached calendar data. Set it for checks made
+            right before booking, where stale data could double-book a slot.
 
     Returns:
         List of available times (empty if no availability).
@@ -38,10 +45,22 @@ def _get_available_slots_for_calendar(
 
     if use_google and google_calendar_id:
         try:
+            day_mask = (
+                None if fresh else get_cached_day_mask(google_calendar_id, target_date)
+            )
+            if day_mask is not None:
+                log.debug(
+                    "availability",
+                    "Using cached day mask",
+                    calendar_id=google_calendar_id,
+                    date=target_date,
+                )
+                return enumerate_slots(*day_mask, duration_minutes)
+
             client = get_calendar_client()
 
-            availability_blocks = client.get_availability_blocks(
-                google_calendar_id, target_date
+            availability_blocks, booked_slots = client.get_day_events(
+                google_calendar_id, target_date, fresh=fresh
             )
 
             log.debug(
@@ -56,7 +75,6 @@ def _get_available_slots_for_calendar(
                 log.debug("availability", "No marker events - employee not available")
                 return []
 
-            booked_slots = client.get_booked_slots(google_calendar_id, target_date)
             log.debug(
                 "availability",
                 "Booked slots",
@@ -64,9 +82,9 @@ def _get_available_slots_for_calendar(
                 slots=booked_slots,
             )
 
-            return calculate_available_slots(
-                availability_blocks, booked_slots, duration_minutes
-            )
+            day_mask = build_day_mask(availability_blocks, booked_slots)
+            cache_day_mask(google_calendar_id, target_date, day_mask)
+            return enumerate_slots(*day_mask, duration_minutes)
 
         except Exception as e:
             log.error("availability", "Error consultando Google Calendar", error=str(e))
@@ -81,7 +99,7 @@ def _get_available_slots_for_calendar(
     appointments = container.appointments.get_by_calendar_and_date(
         calendar_id, target_date
     )
-    booked_slots = [(apt.start_time, apt.end_time) for apt in appointments]
+    booked_slots = ((apt.start_time, apt.end_time) for apt in appointments)
 
     return calculate_available_slots(
         availability_blocks, booked_slots, duration_minutes
@@ -116,10 +134,9 @@ def get_available_slots(
     service = container.services.find_by_name(branch_id, service_name)
     if not service:
         log.warn("availability", "Service not found", service_name=service_name)
-        all_services = container.services.get_by_branch(branch_id)
-        if all_services:
-            names = [s.name for s in all_services]
-            return f"No encontré el servicio '{service_name}'. Disponibles: {', '.join(names)}"
+        names = container.services.suggest_names(branch_id, service_name)
+        if names:
+            return f"No encontré el servicio '{service_name}'. Algunos servicios disponibles: {', '.join(names)} (usa get_services para ver la lista completa)"
         return f"No encontré el servicio '{service_name}'."
 
     try:
@@ -156,7 +173,7 @@ def get_available_slots(
         "service": service.name,
         "date": target_date,
         "duration_minutes": service.duration_minutes,
-        "price": float(service.price),
+        "price": service.price_float,
         "availability": [],
     }
 
@@ -227,8 +244,7 @@ def get_calendar_availability(
         log.warn("availability", "Calendar not found", calendar_name=calendar_name)
         calendars = container.calendars.get_by_branch(branch_id)
         if calendars:
-            names = [c.name for c in calendars]
-            return f"No encontré a '{calendar_name}'. Empleados disponibles: {', '.join(names)}"
+            return f"No encontré a '{calendar_name}'. Empleados disponibles: {', '.join(c.name for c in calendars)}"
         return f"No encontré a '{calendar_name}'."
 
     try:
@@ -238,10 +254,9 @@ def get_calendar_availability(
 
     try:
         client = get_calendar_client()
-        availability_blocks = client.get_availability_blocks(
+        availability_blocks, booked_slots = client.get_day_events(
             calendar.google_calendar_id, parsed_date
         )
-        booked_slots = client.get_booked_slots(calendar.google_calendar_id, parsed_date)
 
         return {
             "calendar_name": calendar.name,
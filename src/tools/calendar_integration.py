@@ -9,19 +9,16 @@ Example:
 """
 
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from ..config.env import get_agent_name
-from datetime import datetime, date, time, timedelta
-from typing import Optional
+from datetime import datetime, date, time, timedelta, timezone
+from time import monotonic
+from typing import Callable, Hashable, Iterable, Optional
 from pathlib import Path
 
-from google.oauth2.credentials import Credentials
-
 from ..config import logger as log
-from google.oauth2 import service_account
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
@@ -33,181 +30,464 @@ CREDENTIALS_PATH = Path(
 )
 TOKEN_PATH = Path(__file__).parent.parent.parent / "config" / "token.json"
 
+CALENDAR_TIME_ZONE = "America/Guayaquil"
+
+# Maximum page size allowed by events.list
+EVENTS_PAGE_SIZE = 250
+
+# Only the event fields used to compute availability
+EVENTS_LIST_FIELDS = (
+    "items(summary,start/dateTime,start/date,end/dateTime,end/date),nextPageToken"
+)
+
+# Seconds listed events and day masks are reused before Google Calendar is
+# queried again
+CALENDAR_CACHE_TTL_SECONDS = 15
+
+# Maximum (calendar, date) entries kept per cache
+CALENDAR_CACHE_MAXSIZE = 256
+
+
+class _TTLCache:
+    """Thread-safe cache whose entries expire after a fixed time.
+
+    Entries are kept in insertion order, so expired ones are purged from the
+    front on every write and the oldest are evicted beyond maxsize.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int):
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        """Returns the value stored under key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if monotonic() - stored_at >= self._ttl:
+                del self._data[key]
+                return None
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        """Stores value under key, dropping expired and excess entries."""
+        now = monotonic()
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (now, value)
+            while self._data:
+                oldest_key, (stored_at, _) = next(iter(self._data.items()))
+                if now - stored_at < self._ttl and len(self._data) <= self._maxsize:
+                    break
+                del self._data[oldest_key]
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drops every entry whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+
+@lru_cache(maxsize=1)
+def _marker_name() -> str:
+    """Returns the lowercased availability marker name.
+
+    AGENT_NAME is read once per process; changing it requires a restart.
+    """
+    return get_agent_name().lower()
+
+
+def _parse_iso(value: str) -> datetime:
+    """Parses an RFC3339 timestamp from Google Calendar.
+
+    fromisoformat accepts a trailing "Z" since Python 3.11, so the string is
+    only rewritten when the direct parse fails.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+_timezones: dict[str, timezone] = {"Z": timezone.utc}
+
+
+def _parse_gcal_dt(value: str) -> datetime:
+    """Parses Google Calendar's canonical YYYY-MM-DDTHH:MM:SS[.fff](Z|±HH:MM).
+
+    Fields are sliced at fixed positions and offsets are cached per string,
+    so the common case skips the general ISO grammar. Anything else, such
+    as all-day dates, goes through _parse_iso.
+    """
+    if len(value) < 20 or value[10] != "T":
+        return _parse_iso(value)
+
+    pos = 19
+    microsecond = 0
+    if value[pos] == ".":
+        end = pos + 1
+        while end < len(value) and value[end].isdigit():
+            end += 1
+        microsecond = int(value[pos + 1 : end][:6].ljust(6, "0"))
+        pos = end
+
+    offset = value[pos:]
+    tzinfo = _timezones.get(offset)
+    if tzinfo is None:
+        if len(offset) != 6 or offset[0] not in "+-" or offset[3] != ":":
+            return _parse_iso(value)
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+        tzinfo = timezone(-delta if offset[0] == "-" else delta)
+        _timezones[offset] = tzinfo
+
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        microsecond,
+        tzinfo,
+    )
+
+
+def _split_day_events(
+    events: list[dict], marker_name: str
+) -> tuple[list[tuple[time, time]], list[tuple[time, time]]]:
+    """Splits the events of a day into availability blocks and booked slots.
+
+    Args:
+        events: Raw event resources ordered by start time.
+        marker_name: Lowercased availability marker name.
+
+    Returns:
+        Tuple of (availability_blocks, booked_slots).
+    """
+    availability_blocks = []
+    booked_slots = []
+    debug = log.is_debug_enabled()
+
+    for event in events:
+        if debug:
+            log.debug(
+                "gcal",
+                "Event found",
+                summary=event.get("summary"),
+                start=event["start"],
+                end=event["end"],
+            )
+
+        summary = event.get("summary") or ""
+        is_marker = marker_name in summary or marker_name in summary.lower()
+
+        start = event["start"].get("dateTime", event["start"].get("date"))
+        end = event["end"].get("dateTime", event["end"].get("date"))
+        is_timed = "T" in start
+        if not is_marker and not is_timed:
+            continue
+
+        start_dt = _parse_gcal_dt(start)
+        end_dt = _parse_gcal_dt(end)
+
+        if is_marker:
+            availability_blocks.append((start_dt.time(), end_dt.time()))
+            if debug:
+                log.debug(
+                    "gcal",
+                    "Added availability block",
+                    start=start_dt.time(),
+                    end=end_dt.time(),
+                )
+            continue
+
+        booked_slots.append((start_dt.time(), end_dt.time()))
+
+    return availability_blocks, booked_slots
+
+
+def _save_token(creds) -> None:
+    """Writes user credentials to TOKEN_PATH.
+
+    The file is replaced atomically so other worker processes never read a
+    partially written token. Saving is best-effort: if the write fails (e.g.
+    a read-only config directory), a warning is logged and the credentials
+    stay usable in memory.
+    """
+    tmp_path = TOKEN_PATH.with_name(f"{TOKEN_PATH.name}.{os.getpid()}.tmp")
+    try:
+        TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(creds.to_json())
+        os.replace(tmp_path, TOKEN_PATH)
+    except OSError as e:
+        log.warn("gcal", "Could not save token", path=str(TOKEN_PATH), error=str(e))
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _load_credentials():
+    """Loads Google Calendar credentials once per process.
+
+    Refreshed user tokens are written back to TOKEN_PATH, so workers that
+    start later reuse the fresh access token instead of refreshing again.
+
+    Raises:
+        FileNotFoundError: If neither a token nor a credentials file exists.
+    """
+    from google.oauth2 import service_account
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+
+    creds = None
+
+    if TOKEN_PATH.exists():
+        creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+            _save_token(creds)
+        elif CREDENTIALS_PATH.exists():
+            import json
+
+            with open(CREDENTIALS_PATH) as f:
+                creds_data = json.load(f)
+
+            if creds_data.get("type") == "service_account":
+                creds = service_account.Credentials.from_service_account_file(
+                    str(CREDENTIALS_PATH), scopes=SCOPES
+                )
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(
+                    str(CREDENTIALS_PATH), SCOPES
+                )
+                creds = flow.run_local_server(port=0)
+
+            if hasattr(creds, "refresh_token"):
+                _save_token(creds)
+        else:
+            raise FileNotFoundError(
+                f"No se encontró archivo de credenciales en {CREDENTIALS_PATH}. "
+                "Por favor configura GOOGLE_CALENDAR_CREDENTIALS_PATH o coloca el archivo."
+            )
+
+    return creds
+
 
 class GoogleCalendarClient:
     """Client for interacting with Google Calendar API."""
 
     def __init__(self):
         self.service = None
+        self._credentials = None
+        self._local = threading.local()
+        self._events_cache = _TTLCache(CALENDAR_CACHE_TTL_SECONDS, CALENDAR_CACHE_MAXSIZE)
         self._authenticate()
 
     def _authenticate(self):
         """Authenticates with Google Calendar API."""
-        creds = None
-
-        if TOKEN_PATH.exists():
-            creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
-
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            elif CREDENTIALS_PATH.exists():
-                import json
-
-                with open(CREDENTIALS_PATH) as f:
-                    creds_data = json.load(f)
-
-                if creds_data.get("type") == "service_account":
-                    creds = service_account.Credentials.from_service_account_file(
-                        str(CREDENTIALS_PATH), scopes=SCOPES
-                    )
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        str(CREDENTIALS_PATH), SCOPES
-                    )
-                    creds = flow.run_local_server(port=0)
-
-                if hasattr(creds, "refresh_token"):
-                    TOKEN_PATH.parent.mkdir(parents=True, exist_ok=True)
-                    with open(TOKEN_PATH, "w") as token:
-                        token.write(creds.to_json())
-            else:
-                raise FileNotFoundError(
-                    f"No se encontró archivo de credenciales en {CREDENTIALS_PATH}. "
-                    "Por favor configura GOOGLE_CALENDAR_CREDENTIALS_PATH o coloca el archivo."
-                )
+        from googleapiclient.discovery import build
+
+        creds = _load_credentials()
+        self._credentials = creds
+
+        # Use the discovery document bundled with the client library instead of
+        # fetching it (or probing the discovery file cache) on every start.
+        self.service = build(
+            "calendar",
+            "v3",
+            credentials=creds,
+            static_discovery=True,
+            cache_discovery=False,
+        )
 
-        self.service = build("calendar", "v3", credentials=creds)
+    def _http(self):
+        """Returns the authorized HTTP transport of the current thread.
 
-    def get_availability_blocks(
+        httplib2.Http is not thread-safe, so concurrent tool calls each get
+        their own connection while sharing the credentials and the service.
+        build_http() applies the client library's default socket timeout and
+        redirect handling, as build() does for the shared transport.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http
+
+            http = AuthorizedHttp(self._credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def _day_list_request(
+        self,
+        calendar_id: str,
+        target_date: date,
+        q: Optional[str] = None,
+        page_token: Optional[str] = None,
+    ):
+        """Builds the events.list request for one page of a day."""
+        start_datetime = datetime.combine(target_date, time(0, 0))
+        end_datetime = datetime.combine(target_date, time(23, 59, 59))
+
+        return self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=start_datetime.isoformat() + "Z",
+            timeMax=end_datetime.isoformat() + "Z",
+            singleEvents=True,
+            orderBy="startTime",
+            maxResults=EVENTS_PAGE_SIZE,
+            fields=EVENTS_LIST_FIELDS,
+            q=q,
+            pageToken=page_token,
+        )
+
+    def _list_day_events(
+        self,
+        calendar_id: str,
+        target_date: date,
+        q: Optional[str] = None,
+    ) -> list[dict]:
+        """Lists all events of a day, following pagination.
+
+        Pages are fetched while a nextPageToken is returned: a page may hold
+        fewer events, or none at all, even when more events match. timeMax
+        already bounds the results to the requested day.
+
+        Args:
+            calendar_id: Google Calendar ID.
+            target_date: Date to list events for.
+            q: Optional free text filter.
+
+        Returns:
+            List of raw event resources.
+        """
+        events_result = self._day_list_request(calendar_id, target_date, q).execute(
+            http=self._http()
+        )
+
+        items = []
+        while True:
+            page_items = events_result.get("items", [])
+            items.extend(page_items)
+
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
+
+            events_result = self._day_list_request(
+                calendar_id, target_date, q, page_token
+            ).execute(http=self._http())
+
+        return items
+
+    def _get_cached_events(
         self, calendar_id: str, target_date: date
-    ) -> list[tuple[time, time]]:
-        """Gets availability blocks based on marker events.
+    ) -> Optional[list[dict]]:
+        """Returns the cached events of a day if they have not expired."""
+        return self._events_cache.get((calendar_id, target_date, _marker_name()))
+
+    def _cache_events(
+        self, calendar_id: str, target_date: date, events: list[dict]
+    ) -> None:
+        """Stores the events of a day."""
+        self._events_cache.put((calendar_id, target_date, _marker_name()), events)
+
+    def _get_day_events_cached(
+        self, calendar_id: str, target_date: date, fresh: bool = False
+    ) -> list[dict]:
+        """Lists the events of a day, reusing recent results unless fresh."""
+        events = None if fresh else self._get_cached_events(calendar_id, target_date)
+        if events is None:
+            events = self._list_day_events(calendar_id, target_date)
+            self._cache_events(calendar_id, target_date, events)
+        return events
+
+    def invalidate(self, calendar_id: str, target_date: Optional[date] = None) -> None:
+        """Drops cached events and day masks of a calendar.
 
         Args:
             calendar_id: Google Calendar ID.
-            target_date: Date to search availability.
+            target_date: Date to drop. All dates of the calendar if not given.
+        """
+        self._events_cache.discard_where(
+            lambda key: key[0] == calendar_id
+            and (target_date is None or key[1] == target_date)
+        )
+        invalidate_day_mask(calendar_id, target_date)
+
+    def get_day_events(
+        self, calendar_id: str, target_date: date, fresh: bool = False
+    ) -> tuple[list[tuple[time, time]], list[tuple[time, time]]]:
+        """Gets availability blocks and booked slots of a day in one request.
+
+        Args:
+            calendar_id: Google Calendar ID.
+            target_date: Date to check.
+            fresh: Whether to query Google Calendar even if the day is cached.
 
         Returns:
-            List of (start_time, end_time) tuples where availability exists.
+            Tuple of (availability_blocks, booked_slots), both lists of
+            (start_time, end_time) tuples.
         """
-        marker_name = get_agent_name().lower()
+        from googleapiclient.errors import HttpError
 
-        try:
-            start_datetime = datetime.combine(target_date, time(0, 0))
-            end_datetime = datetime.combine(target_date, time(23, 59, 59))
+        marker_name = _marker_name()
 
+        try:
             log.debug(
                 "gcal",
                 "Searching calendar",
                 calendar_id=calendar_id,
-                date_range=f"{start_datetime} to {end_datetime}",
+                date=target_date,
                 marker=marker_name,
             )
 
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=start_datetime.isoformat() + "Z",
-                    timeMax=end_datetime.isoformat() + "Z",
-                    singleEvents=True,
-                    orderBy="startTime",
-                    q=marker_name,
-                )
-                .execute()
-            )
+            events = self._get_day_events_cached(calendar_id, target_date, fresh)
+            log.debug("gcal", f"Found {len(events)} events")
 
-            marker_events = events_result.get("items", [])
-            log.debug("gcal", f"Found {len(marker_events)} marker events")
+            return _split_day_events(events, marker_name)
 
-            for event in marker_events:
-                log.debug(
-                    "gcal",
-                    "Event found",
-                    summary=event.get("summary"),
-                    start=event["start"],
-                    end=event["end"],
-                )
-
-            availability_blocks = []
-            for event in marker_events:
-                summary = event.get("summary", "").lower()
-                if marker_name in summary:
-                    start = event["start"].get("dateTime", event["start"].get("date"))
-                    end = event["end"].get("dateTime", event["end"].get("date"))
-
-                    start_dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-                    end_dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
+        except HttpError as e:
+            log.error("gcal", "Error accessing Google Calendar", error=str(e))
+            return [], []
 
-                    availability_blocks.append((start_dt.time(), end_dt.time()))
-                    log.debug(
-                        "gcal",
-                        "Added availability block",
-                        start=start_dt.time(),
-                        end=end_dt.time(),
-                    )
+    def get_availability_blocks(
+        self, calendar_id: str, target_date: date
+    ) -> list[tuple[time, time]]:
+        """Gets availability blocks based on marker events.
 
-            return availability_blocks
+        Args:
+            calendar_id: Google Calendar ID.
+            target_date: Date to search availability.
 
-        except HttpError as e:
-            log.error("gcal", "Error accessing Google Calendar", error=str(e))
-            return []
+        Returns:
+            List of (start_time, end_time) tuples where availability exists.
+        """
+        availability_blocks, _ = self.get_day_events(calendar_id, target_date)
+        return availability_blocks
 
     def get_booked_slots(
-        self, calendar_id: str, target_date: date, exclude_marker: bool = True
+        self, calendar_id: str, target_date: date
     ) -> list[tuple[time, time]]:
         """Gets already booked slots (events that are NOT availability markers).
 
         Args:
             calendar_id: Calendar ID.
             target_date: Date to check.
-            exclude_marker: Whether to exclude availability marker events (default True).
 
         Returns:
             List of (start_time, end_time) tuples for booked slots.
         """
-        marker_name = get_agent_name().lower()
-
-        try:
-            start_datetime = datetime.combine(target_date, time(0, 0))
-            end_datetime = datetime.combine(target_date, time(23, 59, 59))
-
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=calendar_id,
-                    timeMin=start_datetime.isoformat() + "Z",
-                    timeMax=end_datetime.isoformat() + "Z",
-                    singleEvents=True,
-                    orderBy="startTime",
-                )
-                .execute()
-            )
-
-            all_events = events_result.get("items", [])
-
-            booked_slots = []
-            for event in all_events:
-                summary = event.get("summary", "").lower()
-
-                if exclude_marker and marker_name in summary:
-                    continue
-
-                start = event["start"].get("dateTime", event["start"].get("date"))
-                end = event["end"].get("dateTime", event["end"].get("date"))
-
-                if "T" in start:
-                    start_dt = datetime.fromisoformat(start.replace("Z", "+00:00"))
-                    end_dt = datetime.fromisoformat(end.replace("Z", "+00:00"))
-
-                    booked_slots.append((start_dt.time(), end_dt.time()))
-
-            return booked_slots
-
-        except HttpError as e:
-            log.error("gcal", "Error getting booked slots", error=str(e))
-            return []
+        _, booked_slots = self.get_day_events(calendar_id, target_date)
+        return booked_slots
 
     def create_appointment_event(
         self,
@@ -231,17 +511,19 @@ class GoogleCalendarClient:
         Returns:
             Tuple of (event_id, meet_link). meet_link is None if not requested.
         """
+        from googleapiclient.errors import HttpError
+
         try:
             event = {
                 "summary": summary,
                 "description": description or "",
                 "start": {
                     "dateTime": start_datetime.isoformat(),
-                    "timeZone": "America/Guayaquil",
+                    "timeZone": CALENDAR_TIME_ZONE,
                 },
                 "end": {
                     "dateTime": end_datetime.isoformat(),
-                    "timeZone": "America/Guayaquil",
+                    "timeZone": CALENDAR_TIME_ZONE,
                 },
             }
 
@@ -261,9 +543,11 @@ class GoogleCalendarClient:
                     body=event,
                     conferenceDataVersion=1 if include_meet_link else 0,
                 )
-                .execute()
+                .execute(http=self._http())
             )
 
+            self.invalidate(calendar_id, start_datetime.date())
+
             event_id = created_event.get("id")
             meet_link = None
 
@@ -283,19 +567,126 @@ class GoogleCalendarClient:
 
     def delete_event(self, calendar_id: str, event_id: str) -> bool:
         """Deletes an event from the calendar."""
+        from googleapiclient.errors import HttpError
+
         try:
             self.service.events().delete(
                 calendarId=calendar_id, eventId=event_id
-            ).execute()
+            ).execute(http=self._http())
+            self.invalidate(calendar_id)
             return True
         except HttpError as e:
             log.error("gcal", "Error deleting event", error=str(e))
             return False
 
 
+MINUTES_PER_DAY = 24 * 60
+
+DayMask = tuple[list[tuple[int, int]], bytearray]
+
+_day_mask_cache = _TTLCache(CALENDAR_CACHE_TTL_SECONDS, CALENDAR_CACHE_MAXSIZE)
+
+
+def _to_minutes(value: time) -> int:
+    """Converts a time of day to minutes since midnight."""
+    return value.hour * 60 + value.minute
+
+
+def _mark_busy(busy_mask: bytearray, start_mins: int, end_mins: int) -> None:
+    """Marks the minutes in [start_mins, end_mins) as busy."""
+    if end_mins > start_mins:
+        busy_mask[start_mins:end_mins] = b"\x01" * (end_mins - start_mins)
+
+
+def build_day_mask(
+    availability_blocks: Iterable[tuple[time, time]],
+    booked_slots: Iterable[tuple[time, time]],
+) -> DayMask:
+    """Builds the per-minute busy mask of a day.
+
+    Args:
+        availability_blocks: Blocks where availability exists (from marker events).
+        booked_slots: Already booked slots (any iterable, consumed once).
+
+    Returns:
+        Tuple of (avail_ranges, busy_mask). avail_ranges holds (start, end)
+        minutes of each availability block; busy_mask has one byte per minute
+        of the day, set to 1 when that minute is booked.
+    """
+    avail_ranges = [
+        (_to_minutes(start), _to_minutes(end)) for start, end in availability_blocks
+    ]
+    booked = sorted(
+        (_to_minutes(start), _to_minutes(end)) for start, end in booked_slots
+    )
+
+    busy_mask = bytearray(MINUTES_PER_DAY)
+    run_start = run_end = 0
+    for booked_start_mins, booked_end_mins in booked:
+        # Overlapping bookings are coalesced so each busy minute is set once
+        if booked_start_mins > run_end:
+            _mark_busy(busy_mask, run_start, run_end)
+            run_start = booked_start_mins
+        run_end = max(run_end, booked_end_mins)
+    _mark_busy(busy_mask, run_start, run_end)
+
+    return avail_ranges, busy_mask
+
+
+def enumerate_slots(
+    avail_ranges: list[tuple[int, int]],
+    busy_mask: bytearray,
+    duration_minutes: int,
+    interval: Optional[int] = None,
+) -> list[time]:
+    """Enumerates free slots of a day from its busy mask.
+
+    Args:
+        avail_ranges: (start, end) minutes of each availability block.
+        busy_mask: Per-minute busy mask from build_day_mask.
+        duration_minutes: Service duration.
+        interval: Minutes between slot starts (defaults to duration_minutes).
+
+    Returns:
+        List of available start times.
+    """
+    interval = interval or duration_minutes
+    debug = log.is_debug_enabled()
+    free_mins = []
+
+    for avail_start_mins, avail_end_mins in avail_ranges:
+        if debug:
+            log.debug(
+                "slots",
+                "Processing block",
+                start_mins=avail_start_mins,
+                end_mins=avail_end_mins,
+            )
+
+        slot_starts = range(
+            avail_start_mins, avail_end_mins - duration_minutes + 1, interval
+        )
+        block_mins = [
+            start_mins
+            for start_mins in slot_starts
+            if busy_mask.find(1, start_mins, start_mins + duration_minutes) == -1
+        ]
+        free_mins.extend(block_mins)
+
+        if debug:
+            log.debug(
+                "slots",
+                f"Generated {len(block_mins)} slots in block",
+                sample=["%02d:%02d" % divmod(m, 60) for m in block_mins[:5]],
+            )
+
+    log.debug("slots", f"Total slots generated: {len(free_mins)}")
+    return [time(*divmod(m, 60)) for m in free_mins]
+
+
 def calculate_available_slots(
     availability_blocks: list[tuple[time, time]],
-    booked_slots: list[tuple[time, time]],
+    booked_slots: Iterable[tuple[time, time]],
     duration_minutes: int,
 ) -> list[time]:
     """Calculates available slots based on availability blocks and booked slots.
@@ -306,69 +697,42 @@ def calculate_available_slots(
 
     Args:
         availability_blocks: Blocks where availability exists (from marker events).
-        booked_slots: Already booked slots.
+        booked_slots: Already booked slots (any iterable, consumed once).
         duration_minutes: Service duration (also used as slot interval).
 
     Returns:
         List of available start times.
     """
-    log.debug(
-        "slots",
-        "calculate_available_slots",
-        availability_blocks=availability_blocks,
-        booked_slots=booked_slots,
-        duration_minutes=duration_minutes,
-    )
-
-    available_slots = []
-
-    for avail_start, avail_end in availability_blocks:
-        avail_start_mins = avail_start.hour * 60 + avail_start.minute
-        avail_end_mins = avail_end.hour * 60 + avail_end.minute
-
+    if log.is_debug_enabled():
+        booked_slots = list(booked_slots)
         log.debug(
             "slots",
-            "Processing block",
-            start=avail_start,
-            end=avail_end,
-            start_mins=avail_start_mins,
-            end_mins=avail_end_mins,
+            "calculate_available_slots",
+            availability_blocks=availability_blocks,
+            booked_slots=booked_slots,
+            duration_minutes=duration_minutes,
         )
 
-        current_mins = avail_start_mins
-        slots_in_block = []
-        while current_mins + duration_minutes <= avail_end_mins:
-            slot_start = time(current_mins // 60, current_mins % 60)
-            slot_end_mins = current_mins + duration_minutes
-            slot_end = time(slot_end_mins // 60, slot_end_mins % 60)
-
-            is_available = True
-            for booked_start, booked_end in booked_slots:
-                booked_start_mins = booked_start.hour * 60 + booked_start.minute
-                booked_end_mins = booked_end.hour * 60 + booked_end.minute
-
-                if not (
-                    slot_end_mins <= booked_start_mins
-                    or current_mins >= booked_end_mins
-                ):
-                    is_available = False
-                    break
+    avail_ranges, busy_mask = build_day_mask(availability_blocks, booked_slots)
+    return enumerate_slots(avail_ranges, busy_mask, duration_minutes)
 
-            if is_available:
-                available_slots.append(slot_start)
-                slots_in_block.append(slot_start.strftime("%H:%M"))
 
-            # Use service duration as interval to prevent overlapping appointments
-            current_mins += duration_minutes
+def get_cached_day_mask(calendar_id: str, target_date: date) -> Optional[DayMask]:
+    """Returns the cached day mask of a calendar if it has not expired."""
+    return _day_mask_cache.get((calendar_id, target_date))
 
-        log.debug(
-            "slots",
-            f"Generated {len(slots_in_block)} slots in block",
-            sample=slots_in_block[:5],
-        )
 
-    log.debug("slots", f"Total slots generated: {len(available_slots)}")
-    return available_slots
+def cache_day_mask(calendar_id: str, target_date: date, day_mask: DayMask) -> None:
+    """Stores the day mask of a calendar."""
+    _day_mask_cache.put((calendar_id, target_date), day_mask)
+
+
+def invalidate_day_mask(calendar_id: str, target_date: Optional[date] = None) -> None:
+    """Drops cached day masks of a calendar (all dates if none is given)."""
+    _day_mask_cache.discard_where(
+        lambda key: key[0] == calendar_id
+        and (target_date is None or key[1] == target_date)
+    )
 
 
 _calendar_client: Optional[GoogleCalendarClient] = None
@@ -23,29 +23,30 @@ def get_categories(branch_id: str) -> list[dict] | str:
         log.warn("services", "No categories found", branch_id=branch_id)
         return "No se encontraron categorías para esta sucursal."
 
-    log.debug("services", "Categories found", count=len(categories))
-    result = []
-    for cat in categories:
-        services = container.services.get_by_category(cat.id)
-        result.append(
+    if log.is_debug_enabled():
+        log.debug("services", "Categories found", count=len(categories))
+    all_services = container.services.get_by_category_ids([c.id for c in categories])
+    by_category: dict[str, list[dict]] = {}
+    for s in all_services:
+        by_category.setdefault(s.category_id, []).append(
             {
-                "category_id": cat.id,
-                "category_name": cat.name,
-                "description": cat.description,
-                "services_count": len(services),
-                "services": [
-                    {
-                        "service_id": s.id,
-                        "name": s.name,
-                        "price": float(s.price),
-                        "duration_minutes": s.duration_minutes,
-                    }
-                    for s in services
-                ],
+                "service_id": s.id,
+                "name": s.name,
+                "price": s.price_float,
+                "duration_minutes": s.duration_minutes,
             }
         )
 
-    return result
+    return [
+        {
+            "category_id": cat.id,
+            "category_name": cat.name,
+            "description": cat.description,
+            "services_count": len(by_category.get(cat.id, ())),
+            "services": by_category.get(cat.id, []),
+        }
+        for cat in categories
+    ]
 
 
 @tool
@@ -66,14 +67,15 @@ def get_services(branch_id: str) -> list[dict] | str:
         log.warn("services", "No services found", branch_id=branch_id)
         return "No se encontraron servicios para esta sucursal."
 
-    log.debug("services", "Services found", count=len(services))
+    if log.is_debug_enabled():
+        log.debug("services", "Services found", count=len(services))
 
     return [
         {
             "service_id": s.id,
             "name": s.name,
             "category": s.category_name or "Sin categoría",
-            "price": float(s.price),
+            "price": s.price_float,
             "price_formatted": s.price_formatted,
             "duration_minutes": s.duration_minutes,
             "duration_formatted": s.duration_formatted,
@@ -100,21 +102,22 @@ def get_service_details(branch_id: str, service_name: str) -> dict | str:
 
     if not service:
         log.warn("services", "Service not found", service_name=service_name)
-        all_services = container.services.get_by_branch(branch_id)
-        if all_services:
-            names = [s.name for s in all_services]
-            return f"No encontré el servicio '{service_name}'. Servicios disponibles: {', '.join(names)}"
+        names = container.services.suggest_names(branch_id, service_name)
+        if names:
+            return f"No encontré el servicio '{service_name}'. Algunos servicios disponibles: {', '.join(names)} (usa get_services para ver la lista completa)"
         return f"No encontré el servicio '{service_name}'."
 
-    log.debug("services", "Service found", service_id=service.id, duration=service.duration_minutes)
+    if log.is_debug_enabled():
+        log.debug("services", "Service found", service_id=service.id, duration=service.duration_minutes)
     calendars = container.calendars.get_for_service(service.id)
-    log.debug("services", "Available calendars", count=len(calendars))
+    if log.is_debug_enabled():
+        log.debug("services", "Available calendars", count=len(calendars))
 
     return {
         "service_id": service.id,
         "name": service.name,
         "description": service.description,
-        "price": float(service.price),
+        "price": service.price_float,
         "price_formatted": service.price_formatted,
         "duration_minutes": service.duration_minutes,
         "duration_formatted": service.duration_formatted,
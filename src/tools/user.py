@@ -1,12 +1,22 @@
 """Tools for user management."""
 
 import uuid
-from datetime import datetime
+from datetime import date
+from operator import attrgetter
 from langchain_core.tools import tool
 from ..container import get_container
 from ..config import logger as log
 from ..domain.user import User
 
+_MSG_FOUND = (
+    "Usuario encontrado: {name}. IMPORTANTE: Usa user_id='{user_id}' "
+    "para create_appointment (NO uses client_id)."
+)
+_MSG_CREATED = (
+    "Usuario registrado: {name}. IMPORTANTE: Usa user_id='{user_id}' "
+    "para create_appointment (NO uses client_id)."
+)
+
 
 @tool
 def find_or_create_user(
@@ -43,7 +53,7 @@ def find_or_create_user(
             "identification_number": existing.identification_number,
             "phone_number": existing.phone_number,
             "is_new": False,
-            "message": f"Usuario encontrado: {existing.full_name}. IMPORTANTE: Usa user_id='{existing.id}' para create_appointment (NO uses client_id).",
+            "message": _MSG_FOUND.format(name=existing.full_name, user_id=existing.id),
         }
 
     user_id = str(uuid.uuid4())
@@ -63,10 +73,37 @@ def find_or_create_user(
         "identification_number": new_user.identification_number,
         "phone_number": new_user.phone_number,
         "is_new": True,
-        "message": f"Usuario registrado: {new_user.full_name}. IMPORTANTE: Usa user_id='{new_user.id}' para create_appointment (NO uses client_id).",
+        "message": _MSG_CREATED.format(name=new_user.full_name, user_id=new_user.id),
     }
 
 
+_summary_fields = attrgetter(
+    "id",
+    "service_name_snapshot",
+    "appointment_date",
+    "start_time",
+    "calendar_name_snapshot",
+    "status",
+)
+
+
+def _appointment_summaries(appointments) -> list[dict]:
+    """Builds the summaries of appointments shown in user info."""
+    return [
+        {
+            "appointment_id": apt_id,
+            "service": service,
+            "date": apt_date.isoformat(),
+            "time": start.strftime("%H:%M"),
+            "employee": employee,
+            "status": status,
+        }
+        for apt_id, service, apt_date, start, employee, status in map(
+            _summary_fields, appointments
+        )
+    ]
+
+
 @tool
 def get_user_info(client_id: str, identification_number: str) -> dict | str:
     """Gets user information by ID number.
@@ -86,28 +123,16 @@ def get_user_info(client_id: str, identification_number: str) -> dict | str:
         log.warn("user", "User not found", cedula=identification_number)
         return f"No se encontró usuario con cédula {identification_number}"
 
-    log.debug("user", "User found", user_id=user.id, name=user.full_name)
-
-    appointments = container.appointments.get_by_user(user.id)
+    if log.is_debug_enabled():
+        log.debug("user", "User found", user_id=user.id, name=user.full_name)
 
-    today = datetime.now().date()
-    upcoming = []
-    past = []
-
-    for apt in appointments:
-        apt_info = {
-            "appointment_id": apt.id,
-            "service": apt.service_name_snapshot,
-            "date": apt.appointment_date.isoformat(),
-            "time": apt.start_time.strftime("%H:%M"),
-            "employee": apt.calendar_name_snapshot,
-            "status": apt.status,
-        }
-
-        if apt.appointment_date >= today and apt.status == "scheduled":
-            upcoming.append(apt_info)
-        else:
-            past.append(apt_info)
+    today = date.today()
+    upcoming = _appointment_summaries(
+        container.appointments.get_upcoming_by_user(user.id, today)
+    )
+    past = _appointment_summaries(
+        container.appointments.get_recent_past_by_user(user.id, today, limit=5)
+    )
 
     return {
         "user_id": user.id,
@@ -115,6 +140,6 @@ def get_user_info(client_id: str, identification_number: str) -> dict | str:
         "identification_number": user.identification_number,
         "phone_number": user.phone_number,
         "upcoming_appointments": upcoming,
-        "past_appointments": past[:5],
-        "total_appointments": len(appointments),
+        "past_appointments": past,
+        "total_appointments": container.appointments.count_by_user(user.id),
     }
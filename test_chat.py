@@ -4,7 +4,9 @@
 import os
 import sys
 import json
-from datetime import datetime
+import time
+import traceback
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -13,7 +15,6 @@ load_dotenv()
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.syntax import Syntax
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage
 
 from src.container import set_container, get_container
@@ -37,17 +38,36 @@ COLORS = {
     "info": "blue",
 }
 
+_PREFIX = {
+    category: f"[{color}][{category.upper()}][/{color}]"
+    for category, color in COLORS.items()
+}
+
+
+_json_encoder = json.JSONEncoder(ensure_ascii=False)
+
+
+def _short_json(obj, limit: int = 100) -> str:
+    """Encodes obj as JSON, stopping once limit characters are produced."""
+    chunks = []
+    total = 0
+    for chunk in _json_encoder.iterencode(obj):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return "".join(chunks)[:limit]
+
 
 def log(category: str, message: str, data: any = None):
     """Prints formatted log message."""
-    color = COLORS.get(category, "white")
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    console.print(
-        f"[dim]{timestamp}[/dim] [{color}][{category.upper()}][/{color}] {message}"
-    )
+    prefix = _PREFIX.get(category) or f"[white][{category.upper()}][/white]"
+    console.print(f"[dim]{time.strftime('%H:%M:%S')}[/dim] {prefix} {message}")
 
     if data:
         if isinstance(data, dict):
+            from rich.syntax import Syntax
+
             console.print(
                 Syntax(
                     json.dumps(data, indent=2, default=str, ensure_ascii=False),
@@ -62,9 +82,25 @@ def log(category: str, message: str, data: any = None):
             console.print(f"  {data}")
 
 
-def show_db_messages(conversation_id: str):
+@contextmanager
+def buffered_output():
+    """Collects console output and writes it to the terminal in one go."""
+    capture = console.capture()
+    try:
+        with capture:
+            yield
+    finally:
+        console.file.write(capture.get())
+        console.file.flush()
+
+
+def _trunc(text: str, limit: int, suffix: str = "...") -> str:
+    """Shortens text to at most limit characters, marking the cut with suffix."""
+    return text if len(text) <= limit else text[: limit - len(suffix)] + suffix
+
+
+def show_db_messages(container, conversation_id: str):
     """Displays messages stored in database."""
-    container = get_container()
     messages = container.conversations.get_messages(conversation_id)
 
     table = Table(title=f"Messages in DB (conversation_id: {conversation_id[:8]}...)")
@@ -74,8 +110,7 @@ def show_db_messages(conversation_id: str):
     table.add_column("Tool", style="yellow")
 
     for i, msg in enumerate(messages, 1):
-        content = msg.content[:57] + "..." if len(msg.content) > 60 else msg.content
-        table.add_row(str(i), msg.role, content, msg.tool_name or "")
+        table.add_row(str(i), msg.role, _trunc(msg.content, 60), msg.tool_name or "")
 
     console.print(table)
     console.print(f"\n[dim]Total: {len(messages)} messages[/dim]")
@@ -90,33 +125,52 @@ def show_state(state: dict):
     for key, value in state.items():
         if key == "messages":
             value = f"{len(value)} messages"
-        elif isinstance(value, str) and len(value) > 50:
-            value = value[:47] + "..."
+        elif isinstance(value, str):
+            value = _trunc(value, 50)
         table.add_row(key, str(value))
 
     console.print(table)
 
 
+def _format_ai(msg: AIMessage) -> str:
+    """Formats an AI message, listing tool calls when present."""
+    if msg.tool_calls:
+        return f"🤖 AI: [tool_calls: {', '.join(tc['name'] for tc in msg.tool_calls)}]"
+    return f"🤖 AI: {msg.content[:100]}..."
+
+
+def _format_system(msg: SystemMessage) -> str:
+    """Formats a system message; replace markers yield an empty line."""
+    if msg.content == "__REPLACE_MESSAGES__":
+        return ""
+    return f"⚙️ System: {msg.content[:50]}..."
+
+
+_FORMATTERS = {
+    HumanMessage: lambda msg: f"👤 Human: {msg.content[:100]}...",
+    AIMessage: _format_ai,
+    ToolMessage: lambda msg: f"🔧 Tool({msg.name}): {msg.content[:50]}...",
+    SystemMessage: _format_system,
+}
+
+
+def _formatter_for(msg_type: type):
+    """Finds the formatter of a message type or its nearest base class."""
+    for cls in msg_type.__mro__:
+        formatter = _FORMATTERS.get(cls)
+        if formatter is not None:
+            return formatter
+    return None
+
+
 def format_messages_for_display(messages: list) -> str:
-    """Formats messages for log display."""
+    """Formats messages for log display, skipping replace markers."""
     lines = []
     for msg in messages:
-        if isinstance(msg, HumanMessage):
-            lines.append(f"👤 Human: {msg.content[:100]}...")
-        elif isinstance(msg, AIMessage):
-            if msg.tool_calls:
-                tools = [tc["name"] for tc in msg.tool_calls]
-                lines.append(f"🤖 AI: [tool_calls: {', '.join(tools)}]")
-            else:
-                lines.append(f"🤖 AI: {msg.content[:100]}...")
-        elif isinstance(msg, ToolMessage):
-            lines.append(f"🔧 Tool({msg.name}): {msg.content[:50]}...")
-        elif isinstance(msg, SystemMessage):
-            if msg.content == "__REPLACE_MESSAGES__":
-                lines.append("🔄 [REPLACE MARKER]")
-            else:
-                lines.append(f"⚙️ System: {msg.content[:50]}...")
-    return "\n".join(lines)
+        formatter = _formatter_for(type(msg))
+        if formatter is not None:
+            lines.append(formatter(msg))
+    return "\n".join(line for line in lines if line)
 
 
 class LoggingGraph:
@@ -125,6 +179,7 @@ class LoggingGraph:
     def __init__(self):
         self.graph = build_graph().compile()
         self.last_state = {}
+        self.last_response = ""
 
     def invoke(self, input_state: dict, config: dict) -> dict:
         """Invokes graph with step-by-step logging.
@@ -136,90 +191,77 @@ class LoggingGraph:
         Returns:
             dict: Final state after graph execution.
         """
-        console.print("\n" + "=" * 60)
-        log("info", "Starting graph invocation")
-        log(
-            "info",
-            "Input:",
-            {
-                "messages": len(input_state.get("messages", [])),
-                "from_number": input_state.get("from_number"),
-                "to_number": input_state.get("to_number"),
-            },
-        )
-
-        events = []
-        for event in self.graph.stream(input_state, config, stream_mode="updates"):
-            events.append(event)
-
-            for node_name, node_output in event.items():
-                log("node", f"Node: {node_name}")
-
-                if node_output is None:
-                    continue
-
-                if node_name == "load_context":
-                    if "conversation_id" in node_output:
-                        log(
-                            "db",
-                            f"Conversation ID: {node_output['conversation_id'][:8]}...",
-                        )
-                    if "messages" in node_output:
-                        log("info", f"Messages loaded: {len(node_output['messages'])}")
-                        msgs = [
-                            m
-                            for m in node_output["messages"]
-                            if not (
-                                isinstance(m, SystemMessage)
-                                and m.content == "__REPLACE_MESSAGES__"
-                            )
-                        ]
-                        if msgs:
-                            console.print(
-                                Panel(
-                                    format_messages_for_display(msgs),
-                                    title="Messages for LLM",
-                                )
-                            )
-
-                elif node_name == "assistant":
-                    if "messages" in node_output:
-                        for msg in node_output["messages"]:
-                            if isinstance(msg, AIMessage):
-                                if msg.tool_calls:
-                                    log("tool", "LLM decided to call tools:")
-                                    for tc in msg.tool_calls:
-                                        log(
-                                            "tool",
-                                            f"  → {tc['name']}({json.dumps(tc['args'], ensure_ascii=False)[:100]})",
-                                        )
-                                else:
-                                    log("llm", f"LLM response: {msg.content[:200]}...")
-
-                elif node_name == "tools":
-                    if "messages" in node_output:
-                        for msg in node_output["messages"]:
-                            if isinstance(msg, ToolMessage):
-                                result = (
-                                    msg.content[:200] + "..."
-                                    if len(msg.content) > 200
-                                    else msg.content
-                                )
-                                log("tool", f"Result from {msg.name}: {result}")
-
-                elif node_name == "save_final_response":
-                    log("db", "Saving final response to DB")
-
-                elif node_name == "summarize_if_needed":
-                    if "conversation_summary" in node_output:
-                        log("db", "Summary generated/updated")
+        with buffered_output():
+            console.print("\n" + "=" * 60)
+            log("info", "Starting graph invocation")
+            log(
+                "info",
+                "Input:",
+                {
+                    "messages": len(input_state.get("messages", [])),
+                    "from_number": input_state.get("from_number"),
+                    "to_number": input_state.get("to_number"),
+                },
+            )
 
         final_state = {}
-        for event in events:
+        self.last_response = ""
+        for event in self.graph.stream(input_state, config, stream_mode="updates"):
             for node_output in event.values():
                 if node_output is not None:
                     final_state.update(node_output)
 
+            with buffered_output():
+                for node_name, node_output in event.items():
+                    log("node", f"Node: {node_name}")
+
+                    if node_output is None:
+                        continue
+
+                    if node_name == "load_context":
+                        if "conversation_id" in node_output:
+                            log(
+                                "db",
+                                f"Conversation ID: {node_output['conversation_id'][:8]}...",
+                            )
+                        if "messages" in node_output:
+                            log("info", f"Messages loaded: {len(node_output['messages'])}")
+                            display = format_messages_for_display(node_output["messages"])
+                            if display:
+                                console.print(Panel(display, title="Messages for LLM"))
+
+                    elif node_name == "assistant":
+                        if "messages" in node_output:
+                            for msg in node_output["messages"]:
+                                if isinstance(msg, AIMessage):
+                                    if msg.tool_calls:
+                                        log("tool", "LLM decided to call tools:")
+                                        for tc in msg.tool_calls:
+                                            log(
+                                                "tool",
+                                                f"  → {tc['name']}({_short_json(tc['args'])})",
+                                            )
+                                    else:
+                                        log("llm", f"LLM response: {msg.content[:200]}...")
+                                        if msg.content:
+                                            self.last_response = msg.content
+
+                    elif node_name == "tools":
+                        if "messages" in node_output:
+                            for msg in node_output["messages"]:
+                                if isinstance(msg, ToolMessage):
+                                    log(
+                                        "tool",
+                                        f"Result from {msg.name}: {_trunc(msg.content, 200)}",
+                                    )
+
+                    elif node_name == "save_final_response":
+                        log("db", "Saving final response to DB")
+
+                    elif node_name == "summarize_if_needed":
+                        if "conversation_summary" in node_output:
+                            log("db", "Summary generated/updated")
+
         self.last_state = final_state
         console.print("=" * 60 + "\n")
 
@@ -271,7 +313,7 @@ def main():
 
             if user_input.lower() == "/db":
                 if conversation_id:
-                    show_db_messages(conversation_id)
+                    show_db_messages(container, conversation_id)
                 else:
                     console.print("[yellow]No active conversation[/yellow]")
                 continue
@@ -294,17 +336,7 @@ def main():
             if "conversation_id" in result:
                 conversation_id = result["conversation_id"]
 
-            response = ""
-            messages = result.get("messages", [])
-            for msg in reversed(messages):
-                if (
-                    isinstance(msg, AIMessage)
-                    and msg.content
-                    and not getattr(msg, "tool_calls", None)
-                ):
-                    response = msg.content
-                    break
-
+            response = graph.last_response
             if response:
                 console.print(
                     Panel(
@@ -321,8 +353,6 @@ def main():
             break
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
-            import traceback
-
             traceback.print_exc()
 
 